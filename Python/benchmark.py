@@ -6,6 +6,13 @@ import time
 import tempfile
 import os
 import concurrent.futures  # Para execução multithread (paralela)
+import threading
+import array  # Arrays tipados para guardar as amostras brutas dos testes
+import random
+import operator
+import math
+import statistics
+import multiprocessing  # Suporte a processos no executável congelado (PyInstaller)
 from collections import Counter  # Para contar itens em listas
 import numpy as np  # Biblioteca para operações numéricas, aqui usada para testar alocação de RAM
 import json
@@ -162,6 +169,69 @@ def get_usb_devices(w):
     devices = list(set(devices))
     return devices
 
+# Amostras brutas (tempos de cada iteração e telemetria) de todos os testes
+# Cada nome guarda um array tipado de float64, exportado no arquivo .npz ao lado do relatório
+_amostras = {}
+_amostras_lock = threading.Lock()  # Os testes registram amostras a partir de várias threads
+
+# Função que adiciona valores às amostras brutas de um teste
+def registrar_amostras(nome, valores):
+    with _amostras_lock:
+        _amostras.setdefault(nome, array.array('d')).extend(valores)
+
+# Função que executa uma função e retorna o resultado junto com o tempo gasto
+def cronometrar(funcao, *args):
+    start = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - start
+
+# Função que executa uma função n vezes e retorna o tempo de cada execução
+def medir_repeticoes(n, funcao, *args):
+    tempos = array.array('d')
+    for _ in range(n):
+        tempos.append(cronometrar(funcao, *args)[1])
+    return tempos
+
+# Relógio comum (perf_counter) da telemetria e das marcas de início/fim dos testes,
+# para que no .npz seja possível saber quais amostras de telemetria pertencem a cada teste
+_relogio_base = time.perf_counter()
+
+# Função que retorna os segundos desde _relogio_base
+def tempo_relogio():
+    return time.perf_counter() - _relogio_base
+
+# Função que executa um teste e registra seu início e fim em "marca_<nome>" = [inicio, fim]
+def executar_marcado(nome, funcao, *args):
+    inicio = tempo_relogio()
+    try:
+        return funcao(*args)
+    finally:
+        registrar_amostras(f"marca_{nome}", [inicio, tempo_relogio()])
+
+_telemetria_parar = threading.Event()
+
+# Coleta periódica de uso de CPU, uso de RAM e frequência da CPU enquanto os testes rodam
+def coletar_telemetria(intervalo):
+    psutil.cpu_percent(interval=None)  # A primeira leitura só inicializa o contador
+    while not _telemetria_parar.wait(intervalo):
+        freq = psutil.cpu_freq()
+        registrar_amostras("telemetria_tempo", [tempo_relogio()])
+        registrar_amostras("telemetria_cpu_percent", [psutil.cpu_percent(interval=None)])
+        registrar_amostras("telemetria_ram_percent", [psutil.virtual_memory().percent])
+        registrar_amostras("telemetria_cpu_freq", [freq.current if freq else 0])
+
+# Inicia a coleta de telemetria em uma thread separada
+def iniciar_telemetria(intervalo=0.25):
+    _telemetria_parar.clear()
+    thread = threading.Thread(target=coletar_telemetria, args=(intervalo,), daemon=True)
+    thread.start()
+    return thread
+
+# Encerra a coleta de telemetria e espera a thread terminar
+def parar_telemetria(thread):
+    _telemetria_parar.set()
+    thread.join()
+
 # Função que simula trabalho pesado somando quadrados de números em um intervalo
 def trabalho_pesado(start, end):
     total = 0
@@ -178,40 +248,107 @@ def teste_cpu():
     start = time.time()
     # Usa ThreadPoolExecutor para executar trabalho_pesado em paralelo
     with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
-        resultados = list(executor.map(lambda args: trabalho_pesado(*args), ranges))
+        resultados = list(executor.map(lambda args: cronometrar(trabalho_pesado, *args), ranges))
     end = time.time()
 
-    total_final = sum(resultados)  # Soma resultados (não usada mas calculada)
+    registrar_amostras("cpu_soma_quadrados_threads", [tempo for _, tempo in resultados])
+    total_final = sum(total for total, _ in resultados)  # Soma resultados (não usada mas calculada)
     return round(end - start, 3)  # Retorna tempo total em segundos arredondado
 
-# Função para calcular fatorial de um número (usado para teste CPU)
-def fatorial(n):
-    resultado = 1
-    for i in range(2, n+1):
-        resultado *= i
-    return resultado
+# Função que continua um fatorial já calculado: recebe parcial = inicio! e retorna fim!
+def fatorial_incremental(parcial, inicio, fim):
+    for i in range(inicio + 1, fim + 1):
+        parcial *= i
+    return parcial
+
+# Peso de cada operação no índice de big integers (cada tamanho de operando tem o mesmo peso)
+PESOS_BIGNUM = {
+    "multiplicacao": 0.25,
+    "divisao": 0.2,
+    "exponenciacao_modular": 0.25,
+    "conversao_string": 0.15,
+    "fatorial": 0.15,
+}
 
-# Função que calcula fatorial em um intervalo e soma os resultados (para carga)
-def trabalho_fatorial(start, end):
-    total = 0
-    # Faz fatorial de números limitados a 20 para evitar estouro de memória/tempo
-    for i in range(start, end):
-        total += fatorial(i % 200 + 1)
-    return total
+# Mediana do tempo de uma operação (s) por tamanho de operando, medida na máquina de referência
+# (máquina de desenvolvimento, Intel Xeon, CPython 3.11, mediana de 7 execuções). Nessa máquina o índice vale 1.0.
+REFERENCIA_BIGNUM = {
+    4_096: {"multiplicacao": 2.1e-05, "divisao": 3.45e-05, "exponenciacao_modular": 0.00129,
+            "conversao_string": 0.000148, "fatorial": 7.26e-05},
+    16_384: {"multiplicacao": 0.000194, "divisao": 0.000518, "exponenciacao_modular": 0.0134,
+             "conversao_string": 0.00236, "fatorial": 0.00101},
+    65_536: {"multiplicacao": 0.00136, "divisao": 0.00808, "exponenciacao_modular": 0.133,
+             "conversao_string": 0.0343, "fatorial": 0.0122},
+}
 
-# Teste de CPU baseado em cálculo de fatoriais em múltiplas threads
-def teste_cpu_fatorial():
-    num_threads = psutil.cpu_count(logical=True)
-    intervalo = 10000 // num_threads  # Menor intervalo por ser mais pesado
-    ranges = [(i*intervalo, (i+1)*intervalo) for i in range(num_threads)]
+# Função que repete uma função até ter pelo menos min_repeticoes execuções e min_tempo segundos somados
+def medir_por_tempo(min_repeticoes, min_tempo, funcao, *args):
+    tempos = array.array('d')
+    total = 0
+    while len(tempos) < min_repeticoes or total < min_tempo:
+        tempo = cronometrar(funcao, *args)[1]
+        tempos.append(tempo)
+        total += tempo
+    return tempos
+
+# Teste de inteiros de precisão arbitrária (big integers) com operandos de tamanho crescente
+# Mede multiplicação, divisão, exponenciação modular, conversão int <-> string e fatorial incremental
+# Cada operação é repetida em todos os tamanhos e o resultado é um índice de vazão ponderado:
+# média geométrica de (mediana de referência / mediana medida), 1.0 = máquina de referência
+def teste_bignum():
+    rng = random.Random(42)  # Semente fixa para que todas as máquinas façam as mesmas contas
+    tamanhos = [4_096, 16_384, 65_536]  # Tamanho dos operandos em bits
+
+    # A partir do Python 3.11 a conversão int <-> string é limitada a 4300 dígitos por padrão
+    limite_original = sys.get_int_max_str_digits() if hasattr(sys, "get_int_max_str_digits") else None
+    if limite_original is not None:
+        sys.set_int_max_str_digits(0)
+
+    # Fatorial incremental: cada tamanho continua do fatorial do tamanho anterior,
+    # guardando só o último resultado
+    fat_n, fat_valor = 0, 1
 
-    start = time.time()
-    with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
-        resultados = list(executor.map(lambda args: trabalho_fatorial(*args), ranges))
-    end = time.time()
+    resultados = {}
+    soma_log = 0
+    inicio_total = time.perf_counter()
+    try:
+        for bits in tamanhos:
+            a = rng.getrandbits(bits) | (1 << (bits - 1))
+            b = rng.getrandbits(bits) | (1 << (bits - 1))
+            m = rng.getrandbits(bits) | 1
+            expoente = rng.getrandbits(16)
+            produto = a * b
+            fat_fim = bits // 8  # Fatorial proporcional ao tamanho do operando
+
+            # Tempo de cada repetição, por operação (mínimo de 3 repetições e 0,1 s por operação)
+            amostras = {
+                "multiplicacao": medir_por_tempo(3, 0.1, operator.mul, a, b),
+                "divisao": medir_por_tempo(3, 0.1, divmod, produto, b),
+                "exponenciacao_modular": medir_por_tempo(3, 0.1, pow, a, expoente, m),
+                "conversao_string": medir_por_tempo(3, 0.1, lambda x: int(str(x)), produto),
+                "fatorial": medir_por_tempo(3, 0.1, fatorial_incremental, fat_valor, fat_n, fat_fim),
+            }
+            fat_valor, fat_n = fatorial_incremental(fat_valor, fat_n, fat_fim), fat_fim
+
+            resultados[bits] = {}
+            for op, tempos in amostras.items():
+                registrar_amostras(f"bignum_{bits}_{op}", tempos)
+                mediana = statistics.median(tempos)
+                soma_log += PESOS_BIGNUM[op] * math.log(REFERENCIA_BIGNUM[bits][op] / mediana)
+                resultados[bits][op] = {
+                    "repeticoes": len(tempos),
+                    "mediana": mediana,
+                    "ops_por_s": round(1 / mediana, 2)
+                }
+    finally:
+        if limite_original is not None:
+            sys.set_int_max_str_digits(limite_original)
 
-    total_final = sum(resultados)
-    return round(end - start, 3)
+    return {
+        "tamanhos": resultados,
+        "indice": round(math.exp(soma_log / len(tamanhos)), 3),
+        "total": round(time.perf_counter() - inicio_total, 3)
+    }
 
 # Função para testar desempenho de escrita e leitura em um disco específico
 def teste_disco_em_path(mountpoint):
@@ -224,26 +361,23 @@ def teste_disco_em_path(mountpoint):
         data = os.urandom(200 * 1024 * 1024)  # Gera 200 MB de dados aleatórios
 
         # Testa tempo de escrita
-        start_write = time.time()
+        start_write = time.perf_counter()
         with open(temp_path, 'wb') as f:
             f.write(data)
-        end_write = time.time()
+        end_write = time.perf_counter()
 
         # Testa tempo de leitura
-        start_read = time.time()
+        start_read = time.perf_counter()
         with open(temp_path, 'rb') as f:
             f.read()
-        end_read = time.time()
+        end_read = time.perf_counter()
 
         # Remove arquivo e pasta temporária
         os.remove(temp_path)
         os.rmdir(temp_dir)
 
-        # Calcula tempos arredondados
-        tempo_write = round(end_write - start_write, 3)
-        tempo_read = round(end_read - start_read, 3)
-
-        return tempo_write, tempo_read
+        # Tempos brutos; o arredondamento fica para o relatório
+        return end_write - start_write, end_read - start_read
     except Exception:
         # Se erro, retorna -1 para indicar falha no teste
         return -1, -1
@@ -253,33 +387,189 @@ def teste_todos_discos(disks):
     resultados = {}
     for disk in disks:
         write_time, read_time = teste_disco_em_path(disk["mountpoint"])
-        resultados[disk["device"]] = {"write": write_time, "read": read_time}
+        if write_time == -1:
+            resultados[disk["device"]] = {"write": -1, "read": -1}
+        else:
+            resultados[disk["device"]] = {"write": round(write_time, 3), "read": round(read_time, 3)}
+            # Nome do dispositivo (ex: C:\) vira um nome válido para o arquivo .npz
+            nome = "".join(c if c.isalnum() else "_" for c in disk["device"]).strip("_")
+            registrar_amostras(f"disco_{nome}_escrita", [write_time])
+            registrar_amostras(f"disco_{nome}_leitura", [read_time])
     return resultados
 
 # Teste para alocação de RAM criando um grande array e realizando operação simples
 def teste_ram_alocacao():
     try:
-        start = time.time()
+        start = time.perf_counter()
         a = np.zeros((100_000_000,), dtype=np.float64)  # ~800 MB de RAM alocada
         a += 1.0  # Operação para forçar uso da memória
-        end = time.time()
+        end = time.perf_counter()
+        registrar_amostras("ram_alocacao", [end - start])
         tempo = round(end - start, 3)
         return tempo
     except MemoryError:
         # Caso falhe por falta de memória, retorna infinito para indicar problema
         return float('inf')
 
+# Espera todas as cargas do teste de contenção ficarem prontas, para que meçam na mesma janela de tempo
+# (no Windows cada processo ainda importa numpy, psutil e wmi antes de começar)
+def aguardar_largada(barreira):
+    try:
+        barreira.wait(timeout=120)
+    except threading.BrokenBarrierError:
+        pass  # Alguma carga demorou demais ou falhou antes da largada; segue sem sincronizar
+
+# Carga de CPU para o teste de contenção: repete blocos de soma de quadrados até acabar o tempo
+# Retorna milhões de números processados por segundo e o tempo de cada bloco
+def carga_cpu(duracao, barreira):
+    bloco = 200_000
+    processados = 0
+    tempos = array.array('d')
+    aguardar_largada(barreira)
+    start = time.perf_counter()
+    while time.perf_counter() - start < duracao:
+        tempos.append(cronometrar(trabalho_pesado, 0, bloco)[1])
+        processados += bloco
+    return processados / (time.perf_counter() - start) / 1e6, tempos
+
+# Carga de memória para o teste de contenção: copia um buffer de 256 MB repetidamente
+# Retorna a vazão em GB/s (leitura + escrita) e o tempo de cada cópia
+def carga_memoria(duracao, barreira):
+    tempos = array.array('d')
+    try:
+        origem = np.ones((32_000_000,), dtype=np.float64)  # ~256 MB
+        destino = np.empty_like(origem)
+    except MemoryError:
+        aguardar_largada(barreira)  # Libera as outras cargas mesmo sem medir
+        return 0, tempos
+    aguardar_largada(barreira)
+    bytes_movidos = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duracao:
+        tempos.append(cronometrar(np.copyto, destino, origem)[1])
+        bytes_movidos += 2 * origem.nbytes
+    return bytes_movidos / (time.perf_counter() - start) / (1024 ** 3), tempos
+
+# Carga de disco para o teste de contenção: escreve (com fsync) e relê blocos de 64 MB
+# Retorna a vazão em MB/s (escrita + leitura) e o tempo de cada ciclo de escrita e leitura
+def carga_disco(duracao, barreira, mountpoint):
+    temp_dir = os.path.join(mountpoint, "TempBenchmarkContencao")
+    temp_path = os.path.join(temp_dir, "benchmark_contencao.tmp")
+    tempos = array.array('d')
+    try:
+        os.makedirs(temp_dir, exist_ok=True)
+        data = os.urandom(64 * 1024 * 1024)
+    except Exception:
+        data = None
+    aguardar_largada(barreira)  # Espera mesmo se a preparação falhou, para não travar as outras cargas
+    try:
+        if data is None:
+            return -1, tempos
+        bytes_movidos = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < duracao:
+            inicio_ciclo = time.perf_counter()
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())  # Garante que a escrita chegou ao disco
+            with open(temp_path, 'rb') as f:
+                f.read()
+            tempos.append(time.perf_counter() - inicio_ciclo)
+            bytes_movidos += 2 * len(data)
+        return bytes_movidos / (time.perf_counter() - start) / (1024 ** 2), tempos
+    except Exception:
+        return -1, tempos
+    finally:
+        # Falha na limpeza (ex: arquivo travado pelo antivírus) não pode derrubar o teste
+        try:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            if os.path.isdir(temp_dir):
+                os.rmdir(temp_dir)
+        except OSError:
+            pass
+
+# Executa as cargas em processos separados ao mesmo tempo e soma a vazão de cada tipo
+# Usa processos (e não threads) para que as cargas disputem núcleos, caches, memória e disco de verdade
+# As amostras de cada processo voltam junto com a vazão, pois o processo filho não enxerga _amostras
+# Uma barreira compartilhada faz todas as cargas começarem a medir juntas
+# Falhas de um processo ou do pool viram -1 na carga afetada, sem derrubar o benchmark
+def executar_cargas(cargas, duracao, prefixo):
+    resultados = {nome: 0 for nome, _, _ in cargas}
+    try:
+        with multiprocessing.Manager() as manager, \
+                concurrent.futures.ProcessPoolExecutor(max_workers=len(cargas)) as executor:
+            barreira = manager.Barrier(len(cargas))
+            futuros = [(nome, executor.submit(funcao, duracao, barreira, *args)) for nome, funcao, args in cargas]
+            for nome, futuro in futuros:
+                try:
+                    vazao, tempos = futuro.result()
+                except Exception:
+                    # Ex: BrokenProcessPool se o processo da carga morreu
+                    vazao, tempos = -1, array.array('d')
+                if vazao < 0 or resultados[nome] < 0:
+                    resultados[nome] = -1
+                else:
+                    resultados[nome] += vazao
+                registrar_amostras(f"{prefixo}_{nome.lower()}", tempos)
+    except Exception:
+        # Falha ao iniciar o Manager ou o pool de processos: nenhuma carga tem resultado
+        return {nome: -1 for nome in resultados}
+    return resultados
+
+# Teste de contenção: mede CPU, memória e disco sozinhos e depois todos ao mesmo tempo,
+# mostrando quanto cada um perde pela disputa de recursos compartilhados
+def teste_contencao(disks, duracao=5):
+    mountpoint = disks[0]["mountpoint"] if disks else tempfile.gettempdir()
+    # Reserva duas threads lógicas para as cargas de memória e disco
+    # No Windows o ProcessPoolExecutor aceita no máximo 61 processos: 59 de CPU + memória + disco
+    num_cpu = max(1, min(59, psutil.cpu_count(logical=True) - 2))
+
+    cargas = {
+        "CPU": [("CPU", carga_cpu, ())] * num_cpu,
+        "RAM": [("RAM", carga_memoria, ())],
+        "Disco": [("Disco", carga_disco, (mountpoint,))],
+    }
+    unidades = {"CPU": "Mnum/s", "RAM": "GB/s", "Disco": "MB/s"}
+
+    # Linha de base: cada carga rodando sozinha
+    solo = {}
+    for nome, lista in cargas.items():
+        solo.update(executar_marcado(f"contencao_solo_{nome.lower()}", executar_cargas,
+                                     lista, duracao, "contencao_solo"))
+
+    # Todas as cargas rodando simultaneamente
+    todas = [carga for lista in cargas.values() for carga in lista]
+    simultaneo = executar_marcado("contencao_simultaneo", executar_cargas, todas, duracao, "contencao_simultaneo")
+
+    resultados = {}
+    for nome in cargas:
+        base = solo[nome]
+        contido = simultaneo[nome]
+        if base <= 0 or contido < 0:
+            relativo = -1  # Indica falha na carga (ex: disco sem permissão)
+        else:
+            relativo = round(contido / base * 100, 1)
+        resultados[nome] = {
+            "unidade": unidades[nome],
+            "solo": round(base, 2),
+            "simultaneo": round(contido, 2),
+            "percentual": relativo
+        }
+    return resultados
+
 # Função que calcula pontuações baseadas nos tempos e capacidades dos testes
-def calcular_pontuacoes(cpu, ram, disks, tempo_cpu, tempo_cpu_fatorial, tempos_discos, tempo_ram=None):
+def calcular_pontuacoes(cpu, ram, disks, tempo_cpu, indice_bignum, tempos_discos, tempo_ram=None):
     tempo_cpu_ref = 1.0
-    tempo_cpu_fat_ref = 0.05
     tempo_disco_ref = 1.0
     tempo_ram_ref = 0.5
 
     score_cpu_soma = max(0, 10 * (tempo_cpu_ref / tempo_cpu)**0.5)
-    score_cpu_fat = max(0, 10 * (tempo_cpu_fat_ref / tempo_cpu_fatorial)**0.5)
+    # O índice de big integers já é relativo à máquina de referência (1.0 = mesma vazão)
+    score_cpu_bignum = max(0, 10 * indice_bignum**0.5)
     # Limitando CPU a no máximo 10
-    score_cpu = round(min(10, score_cpu_soma * 0.7 + score_cpu_fat * 0.3), 2)
+    score_cpu = round(min(10, score_cpu_soma * 0.7 + score_cpu_bignum * 0.3), 2)
 
     score_ram_cap = min(10, (ram["total"] / 8) * 10)
     score_ram_vel = 10 if tempo_ram is None else min(10, max(0, 10 * (tempo_ram_ref / tempo_ram)**0.5))
@@ -342,91 +632,112 @@ def obter_caminho_pasta_relatorios():
         return caminho_local
 
 def gerar_relatorio(cpu, ram, discos, os_info, placa_mae, uptime, portas_usb, dispositivos_usb,
-                    tempo_cpu=None, tempo_cpu_fatorial=None, tempos_discos=None, tempo_ram=None,
-                    scores=None, erros=None, bios_date=None, win_edition=None, win_version=None, machine_type=None):
+                    tempo_cpu=None, tempos_discos=None, tempo_ram=None,
+                    scores=None, erros=None, bios_date=None, win_edition=None, win_version=None, machine_type=None,
+                    contencao=None, bignum=None):
 
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     nome_arquivo_txt = f"relatorio_benchmark_{timestamp}.txt"
     nome_arquivo_json= f"relatorio_benchmark_{timestamp}.json"
-    relatorio_txt = ""
-
-    # Sistema Operacional
-    relatorio_txt += "[Sistema Operacional]\n"
-    relatorio_txt += f"Sistema: {os_info['system']}\n"
-    relatorio_txt += f"Versão: {os_info['version']}\n"
-    relatorio_txt += f"Release: {os_info['release']}\n"
-    relatorio_txt += f"Arquitetura: {os_info['architecture']}\n"
-    relatorio_txt += f"Uptime: {uptime}\n"
-    relatorio_txt += f"Data BIOS: {bios_date}\n"
-    relatorio_txt += f"Windows: {win_edition} - Versão {win_version}\n"
-    relatorio_txt += f"Tipo de Máquina: {machine_type}\n"
-    relatorio_txt += "="*40 + "\n\n"
-
-    # CPU
-    relatorio_txt += "[CPU]\n"
-    relatorio_txt += f"Nome: {cpu['name']}\n"
-    relatorio_txt += f"Núcleos Físicos: {cpu['cores']}\n"
-    relatorio_txt += f"Núcleos Lógicos: {cpu['threads']}\n"
-    relatorio_txt += f"Frequência Máxima: {cpu['freq']} MHz\n"
-    relatorio_txt += f"Tempo teste soma quadrados: {tempo_cpu}s\n"
-    relatorio_txt += f"Tempo teste fatorial: {tempo_cpu_fatorial}s\n"
-    relatorio_txt += "="*40 + "\n\n"
-
-    # RAM
-    relatorio_txt += "[Memória RAM]\n"
-    relatorio_txt += f"Total: {ram['total']} GB\n"
-    relatorio_txt += f"Usada: {ram['used']} GB\n"
-    relatorio_txt += f"Disponível: {ram['available']} GB\n"
-    relatorio_txt += f"Uso: {ram['percent']}%\n"
-    relatorio_txt += f"Tempo alocação RAM: {tempo_ram}s\n"
-    relatorio_txt += "="*40 + "\n\n"
-
-    # Discos
-    relatorio_txt += "[Discos]\n"
-    for disco in discos:
-        relatorio_txt += f"Disco: {disco['device']} ({disco['mountpoint']})\n"
-        relatorio_txt += f"  Total: {disco['total']} GB\n"
-        relatorio_txt += f"  Livre: {disco['free']} GB\n"
-        relatorio_txt += f"  Usado (%): {disco['used_percent']}%\n"
-        if tempos_discos and disco['device'] in tempos_discos:
-            relatorio_txt += f"  Tempo escrita: {tempos_discos[disco['device']]['write']}s\n"
-            relatorio_txt += f"  Tempo leitura: {tempos_discos[disco['device']]['read']}s\n"
-        relatorio_txt += "\n"
-    relatorio_txt += "="*40 + "\n\n"
-
-    # Placa Mãe
-    relatorio_txt += "[Placa Mãe]\n"
-    relatorio_txt += f"Fabricante: {placa_mae['Fabricante']}\n"
-    relatorio_txt += f"Modelo: {placa_mae['Modelo']}\n"
-    relatorio_txt += "="*40 + "\n\n"
-
-    # Portas USB
-    relatorio_txt += "[Portas USB]\n"
-    for porta in portas_usb:
-        relatorio_txt += f"- {porta}\n"
-    relatorio_txt += "="*40 + "\n\n"
-
-    # Dispositivos USB
-    relatorio_txt += "[Dispositivos USB Detectados]\n"
-    for device in dispositivos_usb:
-        relatorio_txt += f"- {device}\n"
-    relatorio_txt += "="*40 + "\n\n"
-
-    # Erros
-    if erros:
-        relatorio_txt += "[Erros e Avisos]\n"
-        for erro in erros:
-            relatorio_txt += f"- {erro}\n"
-        relatorio_txt += "="*40 + "\n\n"
-
-    # Pontuações
-    if scores:
-        relatorio_txt += "[Pontuações]\n"
-        relatorio_txt += f"CPU: {scores[0]}/10\n"
-        relatorio_txt += f"RAM: {scores[1]}/10\n"
-        relatorio_txt += f"Disco: {scores[2]}/10\n"
-        relatorio_txt += f"Pontuação Final: {scores[3]}/10\n"
-        relatorio_txt += "="*40 + "\n\n"
+    nome_arquivo_npz = f"relatorio_benchmark_{timestamp}.npz"
+
+    pasta_relatorios = obter_caminho_pasta_relatorios()
+
+    caminho_txt = os.path.join(pasta_relatorios, nome_arquivo_txt)
+    caminho_json = os.path.join(pasta_relatorios, nome_arquivo_json)
+    caminho_npz = os.path.join(pasta_relatorios, nome_arquivo_npz)
+
+    # O relatório em texto é escrito direto no arquivo, seção por seção
+    with open(caminho_txt, "w", encoding="utf-8") as f_txt:
+        # Sistema Operacional
+        f_txt.write("[Sistema Operacional]\n")
+        f_txt.write(f"Sistema: {os_info['system']}\n")
+        f_txt.write(f"Versão: {os_info['version']}\n")
+        f_txt.write(f"Release: {os_info['release']}\n")
+        f_txt.write(f"Arquitetura: {os_info['architecture']}\n")
+        f_txt.write(f"Uptime: {uptime}\n")
+        f_txt.write(f"Data BIOS: {bios_date}\n")
+        f_txt.write(f"Windows: {win_edition} - Versão {win_version}\n")
+        f_txt.write(f"Tipo de Máquina: {machine_type}\n")
+        f_txt.write("="*40 + "\n\n")
+
+        # CPU
+        f_txt.write("[CPU]\n")
+        f_txt.write(f"Nome: {cpu['name']}\n")
+        f_txt.write(f"Núcleos Físicos: {cpu['cores']}\n")
+        f_txt.write(f"Núcleos Lógicos: {cpu['threads']}\n")
+        f_txt.write(f"Frequência Máxima: {cpu['freq']} MHz\n")
+        f_txt.write(f"Tempo teste soma quadrados: {tempo_cpu}s\n")
+        if bignum:
+            f_txt.write(f"Índice big integers: {bignum['indice']} (1.0 = máquina de referência, {bignum['total']}s)\n")
+            for bits, operacoes in bignum["tamanhos"].items():
+                detalhes = ", ".join(f"{op} {dados['ops_por_s']} ops/s" for op, dados in operacoes.items())
+                f_txt.write(f"  {bits} bits: {detalhes}\n")
+        f_txt.write("="*40 + "\n\n")
+
+        # RAM
+        f_txt.write("[Memória RAM]\n")
+        f_txt.write(f"Total: {ram['total']} GB\n")
+        f_txt.write(f"Usada: {ram['used']} GB\n")
+        f_txt.write(f"Disponível: {ram['available']} GB\n")
+        f_txt.write(f"Uso: {ram['percent']}%\n")
+        f_txt.write(f"Tempo alocação RAM: {tempo_ram}s\n")
+        f_txt.write("="*40 + "\n\n")
+
+        # Discos
+        f_txt.write("[Discos]\n")
+        for disco in discos:
+            f_txt.write(f"Disco: {disco['device']} ({disco['mountpoint']})\n")
+            f_txt.write(f"  Total: {disco['total']} GB\n")
+            f_txt.write(f"  Livre: {disco['free']} GB\n")
+            f_txt.write(f"  Usado (%): {disco['used_percent']}%\n")
+            if tempos_discos and disco['device'] in tempos_discos:
+                f_txt.write(f"  Tempo escrita: {tempos_discos[disco['device']]['write']}s\n")
+                f_txt.write(f"  Tempo leitura: {tempos_discos[disco['device']]['read']}s\n")
+            f_txt.write("\n")
+        f_txt.write("="*40 + "\n\n")
+
+        # Contenção (somente quando o modo --contencao foi usado)
+        if contencao:
+            f_txt.write("[Contenção (CPU + RAM + Disco simultâneos)]\n")
+            for nome, dados in contencao.items():
+                f_txt.write(f"{nome}: sozinho {dados['solo']} {dados['unidade']} | ")
+                f_txt.write(f"simultâneo {dados['simultaneo']} {dados['unidade']} ({dados['percentual']}%)\n")
+            f_txt.write("="*40 + "\n\n")
+
+        # Placa Mãe
+        f_txt.write("[Placa Mãe]\n")
+        f_txt.write(f"Fabricante: {placa_mae['Fabricante']}\n")
+        f_txt.write(f"Modelo: {placa_mae['Modelo']}\n")
+        f_txt.write("="*40 + "\n\n")
+
+        # Portas USB
+        f_txt.write("[Portas USB]\n")
+        for porta in portas_usb:
+            f_txt.write(f"- {porta}\n")
+        f_txt.write("="*40 + "\n\n")
+
+        # Dispositivos USB
+        f_txt.write("[Dispositivos USB Detectados]\n")
+        for device in dispositivos_usb:
+            f_txt.write(f"- {device}\n")
+        f_txt.write("="*40 + "\n\n")
+
+        # Erros
+        if erros:
+            f_txt.write("[Erros e Avisos]\n")
+            for erro in erros:
+                f_txt.write(f"- {erro}\n")
+            f_txt.write("="*40 + "\n\n")
+
+        # Pontuações
+        if scores:
+            f_txt.write("[Pontuações]\n")
+            f_txt.write(f"CPU: {scores[0]}/10\n")
+            f_txt.write(f"RAM: {scores[1]}/10\n")
+            f_txt.write(f"Disco: {scores[2]}/10\n")
+            f_txt.write(f"Pontuação Final: {scores[3]}/10\n")
+            f_txt.write("="*40 + "\n\n")
 
     # JSON
     relatorio_json = {
@@ -444,7 +755,7 @@ def gerar_relatorio(cpu, ram, discos, os_info, placa_mae, uptime, portas_usb, di
         "CPU": {
             **cpu,
             "Tempo teste soma quadrados": tempo_cpu,
-            "Tempo teste fatorial": tempo_cpu_fatorial
+            "Teste big integers": bignum
         },
         "RAM": {
             **ram,
@@ -452,10 +763,12 @@ def gerar_relatorio(cpu, ram, discos, os_info, placa_mae, uptime, portas_usb, di
         },
         "Discos": discos,
         "Tempos Discos": tempos_discos,
+        "Contenção": contencao,
         "Placa Mãe": placa_mae,
         "Portas USB": portas_usb,
         "Dispositivos USB": dispositivos_usb,
         "Erros": erros,
+        "Amostras": nome_arquivo_npz,
         "Pontuações": {
             "CPU": scores[0] if scores else None,
             "RAM": scores[1] if scores else None,
@@ -464,18 +777,16 @@ def gerar_relatorio(cpu, ram, discos, os_info, placa_mae, uptime, portas_usb, di
         }
     }
 
-    pasta_relatorios = obter_caminho_pasta_relatorios()
-
-    caminho_txt = os.path.join(pasta_relatorios, nome_arquivo_txt)
-    caminho_json = os.path.join(pasta_relatorios, nome_arquivo_json)
-
-    with open(caminho_txt, "w", encoding="utf-8") as f_txt:
-        f_txt.write(relatorio_txt)
-
+    # json.dump grava o JSON no arquivo em partes, sem montar a string inteira em memória
     with open(caminho_json, "w", encoding="utf-8") as f_json:
         json.dump(relatorio_json, f_json, indent=4, ensure_ascii=False)
 
-    print(f"Relatórios salvos em:\n{caminho_txt}\n{caminho_json}")
+    # Amostras brutas de todos os testes em binário (.npz), para análise posterior com np.load
+    with _amostras_lock:
+        arrays = {nome: np.frombuffer(valores, dtype=np.float64) for nome, valores in _amostras.items()}
+        np.savez_compressed(caminho_npz, **arrays)
+
+    print(f"Relatórios salvos em:\n{caminho_txt}\n{caminho_json}\n{caminho_npz}")
     print(f"Pasta onde foram salvos os relatórios: {pasta_relatorios}")
     
 
@@ -483,7 +794,9 @@ def gerar_relatorio(cpu, ram, discos, os_info, placa_mae, uptime, portas_usb, di
     
 # Bloco principal que executa tudo quando o script é rodado
 if __name__ == "__main__":
-    
+    # Necessário para o ProcessPoolExecutor do teste de contenção no executável do PyInstaller
+    multiprocessing.freeze_support()
+
     w = wmi.WMI()  # Instancia objeto WMI para consultas ao Windows
 
     # Obtém todas as informações necessárias
@@ -503,21 +816,32 @@ if __name__ == "__main__":
     os_info = get_os_info()
     print("Finalizado coleta de informações do sistema operacional.\n")  
 
-    # Realiza testes de desempenho
+    # Realiza testes de desempenho, coletando telemetria durante todos eles
+    telemetria = iniciar_telemetria()
+
     print("Iniciando teste de CPU (soma de quadrados)...")  
-    tempo_cpu = teste_cpu()
+    tempo_cpu = executar_marcado("cpu_soma_quadrados", teste_cpu)
     print("Finalizado teste de CPU (soma de quadrados).\n")  
 
-    print("Iniciando teste de CPU (fatorial)...")  
-    tempo_cpu_fatorial = teste_cpu_fatorial()
-    print("Finalizado teste de CPU (fatorial).\n")  
+    print("Iniciando teste de CPU (big integers)...")
+    bignum = executar_marcado("bignum", teste_bignum)
+    print("Finalizado teste de CPU (big integers).\n")
 
-    tempo_ram = teste_ram_alocacao()  
+    tempo_ram = executar_marcado("ram_alocacao", teste_ram_alocacao)
 
     print("Iniciando testes de discos...")  
-    tempos_discos = teste_todos_discos(disks)
+    tempos_discos = executar_marcado("discos", teste_todos_discos, disks)
     print("Finalizado testes de discos.\n")  
 
+    # Teste de contenção é opcional, pois leva alguns segundos a mais
+    contencao = None
+    if "--contencao" in sys.argv:
+        print("Iniciando teste de contenção (CPU, RAM e disco simultâneos)...")
+        contencao = executar_marcado("contencao", teste_contencao, disks)
+        print("Finalizado teste de contenção.\n")
+
+    parar_telemetria(telemetria)
+
     # Outras informações do sistema
     print("Iniciando coleta de uptime da máquina...")  
     uptime = get_uptime(w)
@@ -552,7 +876,7 @@ if __name__ == "__main__":
     erros.extend(verificar_requisitos_avancados(machine_type))
 
     # Calcula pontuações finais
-    scores = calcular_pontuacoes(cpu, ram, disks, tempo_cpu, tempo_cpu_fatorial, tempos_discos, tempo_ram)
+    scores = calcular_pontuacoes(cpu, ram, disks, tempo_cpu, bignum["indice"], tempos_discos, tempo_ram)
 
     # Exibe resumo no terminal
     print("==== RESUMO ====")
@@ -569,24 +893,29 @@ if __name__ == "__main__":
     print("OS:", os_info)
     print("ERROS:", erros)
     print(f"TEMPO CPU (soma quadrados): {tempo_cpu}s")
-    print(f"TEMPO CPU (fatorial): {tempo_cpu_fatorial}s")
+    print(f"ÍNDICE CPU (big integers): {bignum['indice']} ({bignum['total']}s)")
     for dev, tempos in tempos_discos.items():
         print(f"DISCO {dev}: escrita {tempos['write']}s, leitura {tempos['read']}s")
     print("PONTUAÇÕES:", f"CPU: {scores[0]}/10 | RAM: {scores[1]}/10 | Disco: {scores[2]}/10")
     print("PONTUAÇÃO FINAL:", scores[3], "/10")
+    if contencao:
+        for nome, dados in contencao.items():
+            print(f"CONTENÇÃO {nome}: sozinho {dados['solo']} {dados['unidade']}, "
+                  f"simultâneo {dados['simultaneo']} {dados['unidade']} ({dados['percentual']}%)")
 
 
 
     # Gera o relatório completo em arquivo
     placa_mae = {
-    "Fabricante": mb_manufacturer,
-    "Modelo": mb_product
-}
+        "Fabricante": mb_manufacturer,
+        "Modelo": mb_product
+    }
 
-gerar_relatorio(cpu, ram, disks, os_info, placa_mae, uptime, portas_usb, dispositivos_usb,
-                tempo_cpu=tempo_cpu, tempo_cpu_fatorial=tempo_cpu_fatorial, tempos_discos=tempos_discos,
-                tempo_ram=tempo_ram, scores=scores, erros=erros,
-                bios_date=bios_date, win_edition=win_edition, win_version=win_version, machine_type=machine_type)
+    gerar_relatorio(cpu, ram, disks, os_info, placa_mae, uptime, portas_usb, dispositivos_usb,
+                    tempo_cpu=tempo_cpu, tempos_discos=tempos_discos,
+                    tempo_ram=tempo_ram, scores=scores, erros=erros,
+                    bios_date=bios_date, win_edition=win_edition, win_version=win_version, machine_type=machine_type,
+                    contencao=contencao, bignum=bignum)
 
     
 